@@ -1,28 +1,169 @@
-from flask import Flask, jsonify, request, redirect
-from flask_restful import Api, Resource
-from flask_cors import CORS
-from flask_swagger_ui import get_swaggerui_blueprint
-from marshmallow import Schema, fields, ValidationError
+import json
+import os
+import sqlite3
+import threading
+from typing import IO, Any, Callable, Dict, Optional, Tuple, Type
+
+import msgspec
+import orjson
+from flask import Flask, Request, Response, abort, request, redirect
+from flask.typing import ResponseReturnValue
+from flask_swagger_ui import get_swaggerui_blueprint  # type: ignore[import-untyped]
+
+# Item bodies are two short fields; anything bigger is rejected with 413
+MAX_BODY_SIZE = 1024
 
 app = Flask(__name__)
-CORS(app)
-api = Api(app)
+# One byte of slack so _read_body can tell an oversized body from one that is
+# exactly MAX_BODY_SIZE long; Werkzeug caps the stream at this length
+app.config['MAX_CONTENT_LENGTH'] = MAX_BODY_SIZE + 1
+
+# An item as returned by the API: {"id": int, "name": str, "price": float}
+Item = Dict[str, Any]
+
+# SQL statements; sqlite3 keeps them compiled in the connection's statement cache
+_SELECT_ALL = "SELECT id, name, price FROM items ORDER BY id"
+_SELECT_ONE = "SELECT id, name, price FROM items WHERE id = ?"
+_SELECT_BY_NAME = "SELECT id, name, price FROM items WHERE name = ? ORDER BY id"
+# Writes report their outcome through RETURNING rows: the connection is shared
+# by request threads, so lastrowid/rowcount could belong to another statement
+_INSERT = "INSERT INTO items (name, price) VALUES (?, ?) RETURNING id, name, price"
+_UPDATE = "UPDATE items SET name = ?, price = ? WHERE id = ? RETURNING id, name, price"
+_DELETE = "DELETE FROM items WHERE id = ? RETURNING id, name, price"
+
+
+def _item_from_row(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Item:
+    """sqlite3 row factory producing the item dicts the API returns."""
+    return {"id": row[0], "name": row[1], "price": row[2]}
+
+
+# In-memory SQLite data storage (autocommit, shared across request threads)
+db = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+db.row_factory = _item_from_row
+db.execute(
+    "CREATE TABLE items ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, price REAL NOT NULL)"
+)
+# Secondary index so name lookups are B-tree probes rather than table scans
+db.execute("CREATE INDEX items_name_idx ON items (name)")
+db.executemany("INSERT INTO items (id, name, price) VALUES (?, ?, ?)", [
+    (1, "Laptop", 1500),
+    (2, "Phone", 800),
+    (3, "Tablet", 500)
+])
+
+
+def _fetch_item(item_id: int) -> Optional[Item]:
+    """Return the item with the given ID, or None if it does not exist."""
+    item: Optional[Item] = db.execute(_SELECT_ONE, (item_id,)).fetchone()
+    return item
+
+
+# Request body for POST/PUT; decoded and validated in one pass by msgspec
+class ItemIn(msgspec.Struct, forbid_unknown_fields=True):
+    name: str
+    price: float
+
+
+_decode_item = msgspec.json.Decoder(ItemIn).decode
+
+# JSON schema of a POST/PUT body for the Swagger spec; keep in sync with
+# ItemIn, including its rejection of unknown fields
+_ITEM_BODY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "price": {"type": "number"}
+    },
+    "required": ["name", "price"],
+    "additionalProperties": False
+}
+
+
+# Constant success body for DELETE, serialized once
+_ITEM_DELETED_JSON = orjson.dumps({"message": "Item deleted"})
+
+
+def _read_body(stream: IO[bytes]) -> bytes:
+    """Read a request body, aborting with 413 if it exceeds MAX_BODY_SIZE.
 
-# In-memory data storage
-items = [
-    {"id": 1, "name": "Laptop", "price": 1500},
-    {"id": 2, "name": "Phone", "price": 800},
-    {"id": 3, "name": "Tablet", "price": 500}
-]
+    MAX_CONTENT_LENGTH only rejects declared lengths up front; a chunked body
+    without Content-Length is caught here by reading one byte past the limit.
+    Reads loop because a single read may return just one chunk.
+    """
+    body = b""
+    while len(body) <= MAX_BODY_SIZE:
+        chunk = stream.read(MAX_BODY_SIZE + 1 - len(body))
+        if not chunk:
+            break
+        body += chunk
+    if len(body) > MAX_BODY_SIZE:
+        abort(413)
+    return body
 
 
-# Marshmallow schema for validation
-class ItemSchema(Schema):
-    name = fields.Str(required=True)
-    price = fields.Float(required=True)
+def _json_response(payload: Dict[str, Any], status: int = 200) -> Response:
+    """Serialize payload with orjson into a ready-to-send JSON response."""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
 
 
-item_schema = ItemSchema()
+# Serialized {"items": [...]} body for GET /items. Writers rebuild it and
+# publish it with a single reference assignment, so readers never lock.
+_items_snapshot_json: bytes = b""
+# Serialized {"item": ...} bodies of existing items, keyed by ID
+_ITEM_CACHE_SIZE = 1024
+_item_cache: Dict[int, bytes] = {}
+# Bumped by every write; readers only cache a body rendered within one generation
+_write_generation = 0
+# Serializes writers' cache updates against each other and against cache fills
+_publish_lock = threading.Lock()
+
+
+def _republish() -> None:
+    """Rebuild the all-items snapshot from the store and publish it.
+
+    Callers must hold _publish_lock.
+    """
+    global _items_snapshot_json
+    _items_snapshot_json = orjson.dumps({"items": db.execute(_SELECT_ALL).fetchall()})
+
+
+with _publish_lock:
+    _republish()
+
+
+def _render_item_bytes(item_id: int) -> Optional[bytes]:
+    """Serialized {"item": ...} body for item_id, or None if it does not exist.
+
+    Bodies are cached per ID; every write path must call _invalidate_caches().
+    A body is only cached if no write committed while it was being rendered,
+    so a read racing a write can never pin stale data in the cache.
+    """
+    body = _item_cache.get(item_id)
+    if body is not None:
+        return body
+    generation = _write_generation
+    item = _fetch_item(item_id)
+    if item is None:
+        return None
+    body = orjson.dumps({"item": item})
+    with _publish_lock:
+        if generation == _write_generation:
+            if len(_item_cache) >= _ITEM_CACHE_SIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                del _item_cache[next(iter(_item_cache))]
+            _item_cache[item_id] = body
+    return body
+
+
+def _invalidate_caches(item_id: int) -> None:
+    """Refresh the serialized response caches after item_id was written."""
+    global _write_generation
+    with _publish_lock:
+        _write_generation += 1
+        _item_cache.pop(item_id, None)
+        _republish()
+
 
 # Swagger UI setup
 SWAGGER_URL = '/swagger'
@@ -35,242 +176,300 @@ swaggerui_blueprint = get_swaggerui_blueprint(
 app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 
 
+@app.after_request
+def add_cors_headers(response: Response) -> Response:
+    """Allow cross-origin access from any origin, answering preflights too."""
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    if request.method == 'OPTIONS':
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    return response
+
+
+@app.errorhandler(413)
+def request_too_large(error: Exception) -> ResponseReturnValue:
+    """JSON body for oversized requests, like every other API error."""
+    return {"message": "Request body too large"}, 413
+
+
 @app.route('/')
-def home():
+def home() -> ResponseReturnValue:
     """Root endpoint; redirects to Swagger UI."""
     return redirect("/swagger")
 
 
-class Item(Resource):
-    def get(self, item_id=None):
-        """
-        Get all items or a single item by ID.
-        Returns:
-            200: Success with items or single item.
-            404: If the item_id is provided but not found.
-        """
-        if item_id:
-            item = next((item for item in items if item["id"] == int(item_id)), None)
-            if not item:
-                return {"message": "Item not found"}, 404
-            return {"item": item}, 200
-        # Return all items
-        return {"items": items}, 200
-
-    def post(self):
-        """
-        Create a new item.
-        Expected JSON: {"name": "string", "price": float}
-
-        Returns:
-            201: Item created successfully.
-            400: Validation error or bad request.
-        """
-        try:
-            data = item_schema.load(request.get_json())
-        except ValidationError as err:
-            return {"message": "Invalid input", "errors": err.messages}, 400
-
-        # Auto-increment ID logic
-        if items:
-            last_id = max(item["id"] for item in items)
-            item_id = last_id + 1
-        else:
-            item_id = 1
-
-        data["id"] = item_id
-        items.append(data)
-        return {"message": "Item created", "item": data}, 201
-
-    def put(self, item_id):
-        """
-        Update an existing item by ID.
-        Expected JSON: {"name": "string", "price": float}
-
-        Returns:
-            200: Item updated.
-            404: Item not found.
-            400: Validation error.
-        """
-        existing_item = next((item for item in items if item["id"] == int(item_id)), None)
-        if not existing_item:
-            return {"message": "Item not found"}, 404
-
-        try:
-            data = item_schema.load(request.get_json())
-        except ValidationError as err:
-            return {"message": "Invalid input", "errors": err.messages}, 400
-
-        existing_item.update(data)
-        return {"message": "Item updated", "item": existing_item}, 200
-
-    def delete(self, item_id):
-        """
-        Delete an item by ID.
-
-        Returns:
-            200: Item deleted.
-            404: Item not found.
-        """
-        global items
-        item = next((item for item in items if item["id"] == int(item_id)), None)
-        if not item:
-            return {"message": "Item not found"}, 404
-        items = [item for item in items if item["id"] != int(item_id)]
-        return {"message": "Item deleted"}, 200
+# API Endpoints
+# The trailing underscore-prefixed defaults bind every module-level name a
+# view's success path uses as a function local, turning global/attribute
+# lookups into LOAD_FAST. Two kinds of name stay global: _items_snapshot_json,
+# which writers rebind so a bound copy would go stale, and names only used on
+# cold error paths (msgspec.DecodeError, str). Flask only passes URL arguments, so
+# callers never override the defaults.
+_Execute = Callable[..., sqlite3.Cursor]
+_JsonResponse = Callable[..., Response]
 
 
-# API Endpoints
-api.add_resource(Item, '/items', '/items/<string:item_id>')
+@app.route('/items', methods=['GET'])
+def get_items(_request: Request = request,
+              _Response: Type[Response] = Response,
+              _json: _JsonResponse = _json_response,
+              _execute: _Execute = db.execute,
+              _select_by_name: str = _SELECT_BY_NAME) -> ResponseReturnValue:
+    """
+    Get all items, optionally filtered by exact name (?name=...).
+    Returns:
+        200: Success with all (matching) items.
+    """
+    # getlist(), not get(): args is a MultiDict, a dict subclass storing lists,
+    # and mypyc compiles .get() on it to dict.get, which returns the raw list
+    names = _request.args.getlist('name')
+    if names:
+        return _json({"items": _execute(_select_by_name, (names[0],)).fetchall()})
+    return _Response(_items_snapshot_json, mimetype='application/json')
 
 
-@app.route('/static/swagger.json')
-def swagger_json():
-    return jsonify({
-        "swagger": "2.0",
-        "info": {
-            "title": "Flask CRUD API",
-            "description": "A sample API for CRUD operations with validation",
-            "version": "1.0.0"
-        },
-        "host": "localhost:5000",
-        "basePath": "/",
-        "schemes": ["http"],
-        "tags": [
-            {
-                "name": "Items",
-                "description": "Item management operations"
-            }
-        ],
-        "consumes": ["application/json"],
-        "produces": ["application/json"],
-        "paths": {
-            "/items": {
-                "get": {
-                    "tags": ["Items"],
-                    "summary": "Get all items",
-                    "responses": {
-                        "200": {
-                            "description": "A list of items",
-                            "examples": {
-                                "application/json": {
-                                    "items": [
-                                        {"id": 1, "name": "Laptop", "price": 1500}
-                                    ]
-                                }
-                            }
-                        }
+@app.route('/items/<int:item_id>', methods=['GET'])
+def get_item(item_id: int,
+             _render: Callable[[int], Optional[bytes]] = _render_item_bytes,
+             _Response: Type[Response] = Response) -> ResponseReturnValue:
+    """
+    Get a single item by ID.
+    Returns:
+        200: Success with the item.
+        404: If the item is not found.
+    """
+    body = _render(item_id)
+    if body is None:
+        return {"message": "Item not found"}, 404
+    return _Response(body, mimetype='application/json')
+
+
+@app.route('/items', methods=['POST'])
+def create_item(_request: Request = request,
+                _read: Callable[[IO[bytes]], bytes] = _read_body,
+                _decode: Callable[[bytes], ItemIn] = _decode_item,
+                _execute: _Execute = db.execute,
+                _insert: str = _INSERT,
+                _invalidate: Callable[[int], None] = _invalidate_caches,
+                _json: _JsonResponse = _json_response) -> ResponseReturnValue:
+    """
+    Create a new item.
+    Expected JSON: {"name": "string", "price": float}
+
+    Returns:
+        201: Item created successfully.
+        400: Validation error or bad request.
+        413: Request body too large.
+    """
+    try:
+        data = _decode(_read(_request.stream))
+    except msgspec.DecodeError as err:
+        return {"message": "Invalid input", "errors": str(err)}, 400
+
+    # fetchall() steps the statement to completion so its write is committed
+    item = _execute(_insert, (data.name, data.price)).fetchall()[0]
+    _invalidate(item["id"])
+    return _json({"message": "Item created", "item": item}, 201)
+
+
+@app.route('/items/<int:item_id>', methods=['PUT'])
+def update_item(item_id: int, _request: Request = request,
+                _read: Callable[[IO[bytes]], bytes] = _read_body,
+                _decode: Callable[[bytes], ItemIn] = _decode_item,
+                _execute: _Execute = db.execute,
+                _update: str = _UPDATE,
+                _invalidate: Callable[[int], None] = _invalidate_caches,
+                _json: _JsonResponse = _json_response) -> ResponseReturnValue:
+    """
+    Update an existing item by ID.
+    Expected JSON: {"name": "string", "price": float}
+
+    Returns:
+        200: Item updated.
+        400: Validation error.
+        404: Item not found.
+        413: Request body too large.
+    """
+    try:
+        data = _decode(_read(_request.stream))
+    except msgspec.DecodeError as err:
+        return {"message": "Invalid input", "errors": str(err)}, 400
+
+    updated = _execute(_update, (data.name, data.price, item_id)).fetchall()
+    if not updated:
+        return {"message": "Item not found"}, 404
+    _invalidate(item_id)
+    return _json({"message": "Item updated", "item": updated[0]})
+
+
+@app.route('/items/<int:item_id>', methods=['DELETE'])
+def delete_item(item_id: int,
+                _execute: _Execute = db.execute,
+                _delete: str = _DELETE,
+                _invalidate: Callable[[int], None] = _invalidate_caches,
+                _Response: Type[Response] = Response,
+                _deleted_json: bytes = _ITEM_DELETED_JSON) -> ResponseReturnValue:
+    """
+    Delete an item by ID.
+
+    Returns:
+        200: Item deleted.
+        404: Item not found.
+    """
+    if not _execute(_delete, (item_id,)).fetchall():
+        return {"message": "Item not found"}, 404
+    _invalidate(item_id)
+    return _Response(_deleted_json, mimetype='application/json')
+
+
+# The Swagger spec is static, so serialize it once at import time
+_SWAGGER_SPEC: Dict[str, Any] = {
+    "swagger": "2.0",
+    "info": {
+        "title": "Flask CRUD API",
+        "description": "A sample API for CRUD operations with validation",
+        "version": "1.0.0"
+    },
+    "host": "localhost:5000",
+    "basePath": "/",
+    "schemes": ["http"],
+    "tags": [
+        {
+            "name": "Items",
+            "description": "Item management operations"
+        }
+    ],
+    "consumes": ["application/json"],
+    "produces": ["application/json"],
+    "paths": {
+        "/items": {
+            "get": {
+                "tags": ["Items"],
+                "summary": "Get all items",
+                "parameters": [
+                    {
+                        "name": "name",
+                        "in": "query",
+                        "required": False,
+                        "type": "string",
+                        "description": "Only return items with exactly this name"
                     }
-                },
-                "post": {
-                    "tags": ["Items"],
-                    "summary": "Create a new item",
-                    "parameters": [
-                        {
-                            "in": "body",
-                            "name": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string"},
-                                    "price": {"type": "number"}
-                                },
-                                "required": ["name", "price"]
+                ],
+                "responses": {
+                    "200": {
+                        "description": "A list of items",
+                        "examples": {
+                            "application/json": {
+                                "items": [
+                                    {"id": 1, "name": "Laptop", "price": 1500}
+                                ]
                             }
                         }
-                    ],
-                    "responses": {
-                        "201": {
-                            "description": "Item created"
-                        },
-                        "400": {
-                            "description": "Invalid input"
-                        }
                     }
                 }
             },
-            "/items/{item_id}": {
-                "get": {
-                    "tags": ["Items"],
-                    "summary": "Get a specific item",
-                    "parameters": [
-                        {
-                            "name": "item_id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Item details"
-                        },
-                        "404": {
-                            "description": "Item not found"
-                        }
+            "post": {
+                "tags": ["Items"],
+                "summary": "Create a new item",
+                "parameters": [
+                    {
+                        "in": "body",
+                        "name": "body",
+                        "required": True,
+                        "schema": _ITEM_BODY_SCHEMA
                     }
-                },
-                "put": {
-                    "tags": ["Items"],
-                    "summary": "Update an item",
-                    "parameters": [
-                        {
-                            "name": "item_id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
-                        },
-                        {
-                            "in": "body",
-                            "name": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string"},
-                                    "price": {"type": "number"}
-                                },
-                                "required": ["name", "price"]
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Item updated"
-                        },
-                        "400": {
-                            "description": "Invalid input"
-                        },
-                        "404": {
-                            "description": "Item not found"
-                        }
+                ],
+                "responses": {
+                    "201": {
+                        "description": "Item created"
+                    },
+                    "400": {
+                        "description": "Invalid input"
                     }
-                },
-                "delete": {
-                    "tags": ["Items"],
-                    "summary": "Delete an item",
-                    "parameters": [
-                        {
-                            "name": "item_id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Item deleted"
-                        },
-                        "404": {
-                            "description": "Item not found"
-                        }
+                }
+            }
+        },
+        "/items/{item_id}": {
+            "get": {
+                "tags": ["Items"],
+                "summary": "Get a specific item",
+                "parameters": [
+                    {
+                        "name": "item_id",
+                        "in": "path",
+                        "required": True,
+                        "type": "integer"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Item details"
+                    },
+                    "404": {
+                        "description": "Item not found"
+                    }
+                }
+            },
+            "put": {
+                "tags": ["Items"],
+                "summary": "Update an item",
+                "parameters": [
+                    {
+                        "name": "item_id",
+                        "in": "path",
+                        "required": True,
+                        "type": "integer"
+                    },
+                    {
+                        "in": "body",
+                        "name": "body",
+                        "required": True,
+                        "schema": _ITEM_BODY_SCHEMA
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Item updated"
+                    },
+                    "400": {
+                        "description": "Invalid input"
+                    },
+                    "404": {
+                        "description": "Item not found"
+                    }
+                }
+            },
+            "delete": {
+                "tags": ["Items"],
+                "summary": "Delete an item",
+                "parameters": [
+                    {
+                        "name": "item_id",
+                        "in": "path",
+                        "required": True,
+                        "type": "integer"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Item deleted"
+                    },
+                    "404": {
+                        "description": "Item not found"
                     }
                 }
             }
         }
-    })
+    }
+}
+_SWAGGER_BYTES = json.dumps(_SWAGGER_SPEC).encode("utf-8")
+
+
+@app.route('/static/swagger.json')
+def swagger_json() -> Response:
+    return Response(_SWAGGER_BYTES, mimetype='application/json')
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development server only; see wsgi.py for production deployment
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1')
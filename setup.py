@@ -0,0 +1,39 @@
+"""
+Packaging for the app, with an optional ahead-of-time mypyc build of app.py.
+
+A plain install ships app.py as pure Python:
+
+    pip install .
+
+Set APP_MYPYC=1 to compile app.py with mypyc instead:
+
+    APP_MYPYC=1 pip install .
+    APP_MYPYC=1 python setup.py build_ext --inplace
+
+mypy is declared as a build requirement in pyproject.toml, so isolated
+builds fetch it; for the in-place build, pip install mypy first. The
+in-place build drops a compiled app extension module next to app.py, which
+Python imports in preference to the source, so wsgi.py picks it up unchanged.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get('APP_MYPYC') == '1':
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(['app.py'])
+
+setup(
+    name='flask-crud-api',
+    python_requires='>=3.9',
+    py_modules=['app', 'wsgi'],
+    install_requires=[
+        'flask>=2.0',
+        'flask-swagger-ui',
+        'msgspec',
+        'orjson',
+    ],
+    ext_modules=ext_modules,
+)
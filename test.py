@@ -1,3 +1,6 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import requests
 
@@ -16,6 +19,12 @@ def test_get_all_items():
     assert response.status_code == 200
     assert isinstance(response.json().get("items"), list)
 
+def test_filter_items_by_name():
+    response = requests.get(f"{BASE_URL}/items", params={"name": "Phone"})
+    assert response.status_code == 200
+    items = response.json().get("items")
+    assert [item["id"] for item in items] == [2]
+
 def test_create_item():
     new_item = {"name": "Monitor", "price": 300}
     response = requests.post(f"{BASE_URL}/items", json=new_item)
@@ -25,6 +34,10 @@ def test_create_item():
     assert data["item"]["name"] == "Monitor"
     assert data["item"]["price"] == 300
 
+    # The cached listing must include the new item
+    response = requests.get(f"{BASE_URL}/items")
+    assert data["item"] in response.json().get("items")
+
 def test_get_specific_item():
     response = requests.get(f"{BASE_URL}/items/1")
     assert response.status_code == 200
@@ -41,6 +54,12 @@ def test_update_item():
     assert data["item"]["name"] == "Gaming Laptop"
     assert data["item"]["price"] == 2000
 
+    # Cached single-item and listing responses must reflect the update
+    response = requests.get(f"{BASE_URL}/items/1")
+    assert response.json().get("item") == data["item"]
+    response = requests.get(f"{BASE_URL}/items")
+    assert data["item"] in response.json().get("items")
+
 def test_delete_item():
     response = requests.delete(f"{BASE_URL}/items/3")
     assert response.status_code == 200
@@ -50,3 +69,75 @@ def test_delete_item():
     response = requests.get(f"{BASE_URL}/items/3")
     assert response.status_code == 404
     assert response.json().get("message") == "Item not found"
+
+    # ...and it must be gone from the cached listing
+    response = requests.get(f"{BASE_URL}/items")
+    assert 3 not in [item["id"] for item in response.json().get("items")]
+
+def test_delete_missing_item():
+    response = requests.delete(f"{BASE_URL}/items/999")
+    assert response.status_code == 404
+    assert response.json().get("message") == "Item not found"
+
+def test_create_item_body_too_large():
+    new_item = {"name": "x" * 2048, "price": 1}
+    response = requests.post(f"{BASE_URL}/items", json=new_item)
+    assert response.status_code == 413
+    assert response.json().get("message") == "Request body too large"
+
+MAX_BODY_SIZE = 1024
+
+def _padded_item(size):
+    # Valid item JSON padded to exactly `size` bytes
+    empty = b'{"name": "", "price": 1}'
+    return b'{"name": "' + b"x" * (size - len(empty)) + b'", "price": 1}'
+
+def _chunked(body, chunks=1):
+    # A generator body makes requests use chunked encoding, no Content-Length
+    step = -(-len(body) // chunks)
+    return (body[i:i + step] for i in range(0, len(body), step))
+
+def test_create_item_chunked_at_limit():
+    body = _padded_item(MAX_BODY_SIZE)
+    response = requests.post(f"{BASE_URL}/items", data=_chunked(body),
+                             headers={"Content-Type": "application/json"})
+    assert response.status_code == 201
+
+def test_create_item_chunked_too_large():
+    body = _padded_item(MAX_BODY_SIZE + 1)
+    response = requests.post(f"{BASE_URL}/items", data=_chunked(body),
+                             headers={"Content-Type": "application/json"})
+    assert response.status_code == 413
+    assert response.json().get("message") == "Request body too large"
+
+def test_create_item_chunked_multiple_chunks():
+    body = _padded_item(100)
+    response = requests.post(f"{BASE_URL}/items", data=_chunked(body, chunks=5),
+                             headers={"Content-Type": "application/json"})
+    assert response.status_code == 201
+    assert response.json()["item"]["name"] == json.loads(body)["name"]
+
+def test_concurrent_writes():
+    # Runs in-process: the race between request threads sharing the app's DB
+    # connection is too narrow to hit reliably over HTTP. Each POST and each
+    # PUT to a missing ID must still report its own outcome.
+    from app import app
+
+    def create(i):
+        client = app.test_client()
+        name = f"Concurrent {i}"
+        response = client.post("/items", json={"name": name, "price": i})
+        assert response.status_code == 201
+        item = response.get_json()["item"]
+        assert item["name"] == name
+        assert client.get(f"/items/{item['id']}").get_json().get("item") == item
+
+    def update_missing(i):
+        response = app.test_client().put("/items/999999999", json={"name": "Ghost", "price": i})
+        assert response.status_code == 404
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(create, i) for i in range(1000)]
+        futures += [pool.submit(update_missing, i) for i in range(1000)]
+    for future in futures:
+        future.result()
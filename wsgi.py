@@ -0,0 +1,32 @@
+"""
+WSGI entrypoint for production servers.
+
+Run a single gunicorn worker with threads (this is what the Procfile does):
+
+    gunicorn wsgi:app -w 1 --threads 8 --worker-class=gthread
+
+or, on Windows, with waitress:
+
+    waitress-serve --threads=8 wsgi:app
+
+Threads share app.py's single SQLite connection. That is safe because the
+write handlers read their outcome from each statement's RETURNING rows, never
+from connection-wide state such as lastrowid or rowcount (see
+test_concurrent_writes); keep it that way before raising the thread count.
+
+Serve the app over plain WSGI. Do not wrap it in an ASGI server through
+WSGIMiddleware (uvicorn, a2wsgi, FastAPI mounts): every request then pays
+for an event-loop to threadpool handoff and is several times slower. If
+ASGI ingress is unavoidable, point hypercorn at wsgi:app directly, which
+serves WSGI apps without an extra adapter.
+
+Note: the item store in app.py is an in-memory SQLite database owned by
+the process, so each worker would hold its own copy. With several workers a
+POST lands in one copy and later reads served by another return 404, so
+stay on one worker until the store moves to a shared backend. Do not use
+--preload either: the connection is opened at import time, and SQLite
+connections must not be used in a child process after fork().
+"""
+from app import app
+
+__all__ = ['app']